@@ -1,2 +1,29 @@
 from . import controllers
-from . import core
\ No newline at end of file
+from . import core
+
+# Minimal but complete input that exercises the full solver path once so
+# first-request latency is paid at install time instead.
+_WARMUP_FIXTURE = {
+    'halls': ['Hall A'],
+    'school_days': ['Monday'],
+    'departments': ['General'],
+    'professors': ['Prof A'],
+    'courses': ['Course A'],
+    'level_courses': {'Level1': ['Course A']},
+    'department_courses': {'General': ['Course A']},
+    'professor_specialties': {'Prof A': ['General']},
+    'professor_preferred_courses': {},
+    'professor_preferred_times': {},
+    'course_preferred_times': {},
+    'restricted_times': [],
+    'days_with_hours': {'Monday': {'start': '08:00', 'end': '10:00'}},
+    'course_lecture_durations': {'Course A': 60},
+    'course_sections_count': {'Course A': 1},
+}
+
+
+def _warm_scheduler(env):
+    """Run a tiny solve so solver imports and caches are hot after install."""
+    from .core.schedule_generator import ScheduleGenerator
+
+    ScheduleGenerator().generate(_WARMUP_FIXTURE)
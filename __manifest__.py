@@ -9,7 +9,9 @@
         based on various constraints and preferences.
     ''',
     'depends': ['base'],
+    'external_dependencies': {'python': ['orjson']},
     'data': [],
+    'post_init_hook': '_warm_scheduler',
     'installable': True,
     'application': True,
     'auto_install': False,
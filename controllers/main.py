@@ -1,55 +1,266 @@
-import json
+import concurrent.futures
+import gzip
+import hashlib
+import itertools
 import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import orjson
+
 from odoo import http
 from odoo.http import request, Response
 
-from ..core.schedule_generator import ScheduleGenerator
-
 _logger = logging.getLogger(__name__)
 
+# Required top-level keys in the request payload
+_REQUIRED_FIELDS = frozenset((
+    'halls', 'school_days', 'departments', 'professors', 'courses',
+    'level_courses', 'department_courses', 'days_with_hours',
+    'course_sections_count',
+))
+
+# Health probes are frequent and the body never changes; serialize it once.
+_HEALTH_BODY = orjson.dumps({"status": "ok", "service": "university_scheduler"})
+
+# Largest request body we are willing to parse (64 MiB).
+_MAX_BODY = 64 * 1024 * 1024
+
+# Expected container type for each top-level payload field.
+_FIELD_TYPES = {
+    'halls': list,
+    'school_days': list,
+    'departments': list,
+    'professors': list,
+    'courses': list,
+    'level_courses': dict,
+    'department_courses': dict,
+    'professor_specialties': dict,
+    'professor_preferred_courses': dict,
+    'professor_preferred_times': dict,
+    'course_preferred_times': dict,
+    'restricted_times': list,
+    'days_with_hours': dict,
+    'course_lecture_durations': dict,
+    'course_sections_count': dict,
+}
+
+
+def _validate_payload(data):
+    """Check the payload shape before it reaches the solver.
+
+    Returns an error message, or None if the payload looks well-formed.
+    Catching malformed nested values here is far cheaper than letting the
+    solver crash on them and logging the resulting traceback.
+    """
+    if not isinstance(data, dict):
+        return "Payload must be a JSON object"
+    for field, expected in _FIELD_TYPES.items():
+        value = data.get(field)
+        if value is not None and not isinstance(value, expected):
+            return f"Field '{field}' must be of type {expected.__name__}"
+    for day, hours in data.get('days_with_hours', {}).items():
+        if not isinstance(hours, dict) or 'start' not in hours or 'end' not in hours:
+            return f"days_with_hours['{day}'] must contain 'start' and 'end'"
+    for window in data.get('restricted_times', []):
+        if not isinstance(window, dict) or not {'day', 'start_time', 'end_time'} <= window.keys():
+            return "restricted_times entries must contain 'day', 'start_time' and 'end_time'"
+    for course, count in data.get('course_sections_count', {}).items():
+        if not isinstance(count, int):
+            return f"course_sections_count['{course}'] must be an integer"
+    for course, duration in data.get('course_lecture_durations', {}).items():
+        if not isinstance(duration, int):
+            return f"course_lecture_durations['{course}'] must be an integer"
+    return None
+
+
+# Results of slow solves keyed by input hash, so clients iterating on
+# downstream views don't re-run identical solves. Only solves longer than
+# _CACHE_MIN_SOLVE_S are worth the cache slot.
+_CACHE_MAX_ENTRIES = 32
+_CACHE_MIN_SOLVE_S = 0.512
+_result_cache = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+def _input_etag(data):
+    """Stable hash of the canonicalized (key-sorted) input payload."""
+    canonical = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(canonical, digest_size=16).hexdigest()
+
+
+def _cache_get(key):
+    with _result_cache_lock:
+        result = _result_cache.get(key)
+        if result is not None:
+            _result_cache.move_to_end(key)
+        return result
+
+
+def _cache_put(key, result):
+    with _result_cache_lock:
+        _result_cache[key] = result
+        _result_cache.move_to_end(key)
+        while len(_result_cache) > _CACHE_MAX_ENTRIES:
+            _result_cache.popitem(last=False)
+
+
+# Log a full traceback for 1 in 64 scheduler failures; the rest log the
+# exception message only, which keeps bursts of bad input cheap.
+_err_sampler = itertools.cycle([True] + [False] * 63)
+
+_scheduler_singleton = None
+_scheduler_lock = threading.Lock()
+
+
+def _get_scheduler():
+    """Return the shared ScheduleGenerator, creating it on first use."""
+    global _scheduler_singleton
+    if _scheduler_singleton is None:
+        with _scheduler_lock:
+            if _scheduler_singleton is None:
+                # Imported lazily so workers that never hit the scheduler
+                # endpoint don't pay the solver module's import cost.
+                from ..core.schedule_generator import ScheduleGenerator
+                _scheduler_singleton = ScheduleGenerator()
+    return _scheduler_singleton
+
+
+# Solves are CPU-bound pure Python and would hold the GIL for their full
+# duration; running them in a process pool keeps the HTTP worker thread
+# free to serve other requests while a solver process burns a core.
+_MAX_SOLVE_S = 300.0
+
+_solver_pool = None
+_solver_pool_lock = threading.Lock()
+
+
+def _intern_strings(value, pool):
+    """Collapse duplicated strings in a parsed payload to single objects.
+
+    Course, professor, hall and day names recur across many payload
+    fields; after interning, the solver's dict lookups and equality
+    checks hit canonical objects with cached hashes.
+    """
+    if isinstance(value, str):
+        return pool.setdefault(value, sys.intern(value))
+    if isinstance(value, list):
+        return [_intern_strings(item, pool) for item in value]
+    if isinstance(value, dict):
+        return {
+            _intern_strings(key, pool): _intern_strings(item, pool)
+            for key, item in value.items()
+        }
+    return value
+
+
+def _solve_in_worker(data):
+    """Entry point executed inside a solver process."""
+    return _get_scheduler().generate(_intern_strings(data, {}))
+
+
+def _get_solver_pool():
+    global _solver_pool
+    if _solver_pool is None:
+        with _solver_pool_lock:
+            if _solver_pool is None:
+                _solver_pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                )
+    return _solver_pool
+
+
+# Bodies below this size aren't worth the compression round-trip.
+_MIN_COMPRESS_SIZE = 16 * 1024
+
+
+def _json_response(payload, status=200):
+    """Serialize a response payload once, straight to the wire format.
+
+    Large bodies (full schedules are highly repetitive JSON) are gzipped
+    at the fastest level when the client advertises support.
+    """
+    body = orjson.dumps(payload)
+    headers = None
+    if len(body) >= _MIN_COMPRESS_SIZE:
+        accepted = request.httprequest.headers.get('Accept-Encoding', '')
+        if 'gzip' in accepted:
+            body = gzip.compress(body, compresslevel=1)
+            headers = [('Content-Encoding', 'gzip'), ('Vary', 'Accept-Encoding')]
+    return Response(body, status=status, content_type='application/json', headers=headers)
+
 
 class UniversitySchedulerController(http.Controller):
 
-    @http.route('/api/university_scheduler/generate', type='json', auth='public', methods=['POST'], csrf=False)
-    def generate_schedule(self, **kwargs):
+    @http.route('/api/university_scheduler/generate', type='http', auth='public', methods=['POST'], csrf=False)
+    def generate_schedule(self):
+        # Reject oversized or malformed bodies cheaply, without the
+        # traceback logging reserved for genuine scheduler failures.
+        if request.httprequest.content_length and request.httprequest.content_length > _MAX_BODY:
+            return _json_response({"success": False, "error": "Payload too large"}, status=413)
+
         try:
-            # Get request data
-            data = json.loads(request.httprequest.data)
+            data = orjson.loads(request.httprequest.get_data())
+        except (ValueError, orjson.JSONDecodeError):
+            return _json_response({"success": False, "error": "Invalid JSON"}, status=400)
 
+        try:
             if not data:
-                return {"success": False, "error": "No data provided"}
+                return _json_response({"success": False, "error": "No data provided"}, status=400)
 
             # Validate required fields
-            required_fields = [
-                'halls', 'school_days', 'departments', 'professors', 'courses',
-                'level_courses', 'department_courses', 'days_with_hours',
-                'course_sections_count'
-            ]
+            missing = _REQUIRED_FIELDS.difference(data)
+            if missing:
+                return _json_response(
+                    {"success": False, "error": f"Missing required field: {next(iter(missing))}"},
+                    status=400,
+                )
+
+            error = _validate_payload(data)
+            if error:
+                return _json_response({"success": False, "error": error}, status=400)
 
-            for field in required_fields:
-                if field not in data:
-                    return {"success": False, "error": f"Missing required field: {field}"}
+            # Identical inputs produce identical schedules; answer repeat
+            # calls from the cache (or with a bare 304) instead of
+            # re-running the solver.
+            etag = _input_etag(data)
+            if request.httprequest.headers.get('If-None-Match') == etag:
+                return Response(status=304, headers=[('ETag', etag)])
 
-            # Initialize and run the scheduler
-            scheduler = ScheduleGenerator()
-            result = scheduler.generate(data)
+            result = _cache_get(etag)
+            if result is None:
+                # Each solver process keeps its own ScheduleGenerator
+                # singleton, so per-process caches persist across solves.
+                future = _get_solver_pool().submit(_solve_in_worker, data)
+                started = time.monotonic()
+                try:
+                    result = future.result(timeout=_MAX_SOLVE_S)
+                except concurrent.futures.TimeoutError:
+                    # Cancel if still queued; a solve that already started
+                    # runs to completion in its worker process, but this
+                    # request gets a bounded answer either way.
+                    future.cancel()
+                    _logger.warning("Schedule solve exceeded %.0fs, giving up", _MAX_SOLVE_S)
+                    return _json_response({"success": False, "error": "Solver timeout"}, status=503)
+                elapsed = time.monotonic() - started
+                if elapsed >= _CACHE_MIN_SOLVE_S:
+                    _cache_put(etag, result)
 
-            return {
-                "success": True,
-                "data": result
-            }
+            response = _json_response({"success": True, "data": result})
+            response.headers['ETag'] = etag
+            return response
 
         except Exception as e:
-            _logger.exception("Error generating schedule")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            if next(_err_sampler):
+                _logger.exception("Error generating schedule: %r", e)
+            else:
+                _logger.error("Error generating schedule: %r", e)
+            return _json_response({"success": False, "error": str(e)}, status=500)
 
     @http.route('/api/university_scheduler/health', type='http', auth='none', methods=['GET'], csrf=False)
     def health_check(self):
         """Simple health check endpoint to verify API is running."""
-        return Response(
-            json.dumps({"status": "ok", "service": "university_scheduler"}),
-            content_type='application/json'
-        )
+        return Response(_HEALTH_BODY, content_type='application/json')
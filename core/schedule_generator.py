@@ -3,19 +3,33 @@ University Schedule Generator Core Algorithm - Improved Version
 -------------------------------------------
 This module contains the enhanced core algorithm for generating university class schedules based on a set of constraints and preferences.
 """
+import functools
 import logging
-import random
-from datetime import datetime, timedelta
-from typing import Dict, List, Set, Tuple, Optional, Any
-from collections import defaultdict
+import math
+from typing import Dict, List, NamedTuple, Set, Tuple, Optional, Any
+from collections import Counter, defaultdict
 
 _logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _hhmm_to_min(value: str) -> int:
+    """Convert an 'HH:MM' string to minutes since midnight (cached)."""
+    hours, minutes = value.split(':')
+    return int(hours) * 60 + int(minutes)
+
+
+def _min_to_hhmm(value: int) -> str:
+    """Convert minutes since midnight back to an 'HH:MM' string."""
+    return f"{value // 60:02d}:{value % 60:02d}"
+
+
 class TimeSlot:
     """Represents a time slot with start and end times."""
 
-    def __init__(self, day: str, start_time: str, end_time: str):
+    __slots__ = ('day', 'start_time', 'end_time', 'start_min', 'end_min', 'day_id', 'mask')
+
+    def __init__(self, day: str, start_time: str, end_time: str, day_id: int = -1):
         """
         Initialize a time slot.
 
@@ -23,13 +37,19 @@ class TimeSlot:
             day: Day of the week (e.g., 'Monday')
             start_time: Start time in format 'HH:MM'
             end_time: End time in format 'HH:MM'
+            day_id: Small integer id for the day, assigned by the
+                generator; slots compared together share one id namespace
         """
         self.day = day
         self.start_time = start_time
         self.end_time = end_time
-        # Cache datetime objects for performance
-        self._start_dt = datetime.strptime(start_time, "%H:%M")
-        self._end_dt = datetime.strptime(end_time, "%H:%M")
+        self.day_id = day_id
+        # Cache integer minutes-of-day for fast comparisons
+        self.start_min = _hhmm_to_min(start_time)
+        self.end_min = _hhmm_to_min(end_time)
+        # One bit per minute of the day this slot occupies; two slots on
+        # the same day overlap iff their masks share a bit
+        self.mask = (1 << self.end_min) - (1 << self.start_min)
 
     def __str__(self):
         return f"{self.day} {self.start_time} - {self.end_time}"
@@ -44,11 +64,11 @@ class TimeSlot:
         Returns:
             True if the time slots overlap, False otherwise
         """
-        if self.day != other.day:
+        # Integer day ids decide when assigned; unassigned ids (-1) fall
+        # back to comparing day names
+        if self.day_id != other.day_id or (self.day_id < 0 and self.day != other.day):
             return False
-
-        # Use cached datetime objects for better performance
-        return not (self._end_dt <= other._start_dt or other._end_dt <= self._start_dt)
+        return self.start_min < other.end_min and other.start_min < self.end_min
 
     def get_minutes_difference(self, other: 'TimeSlot') -> int:
         """
@@ -64,44 +84,46 @@ class TimeSlot:
         if self.day != other.day:
             return None
 
-        if self._end_dt <= other._start_dt:  # This slot ends before other starts
-            return int((other._start_dt - self._end_dt).total_seconds() / 60)
-        elif other._end_dt <= self._start_dt:  # Other slot ends before this starts
-            return -int((self._start_dt - other._end_dt).total_seconds() / 60)
+        if self.end_min <= other.start_min:  # This slot ends before other starts
+            return other.start_min - self.end_min
+        elif other.end_min <= self.start_min:  # Other slot ends before this starts
+            return other.end_min - self.start_min
         else:  # Slots overlap
             return 0
 
 
-class ScheduleSection:
-    """Represents a scheduled course section with all necessary details."""
+class ScheduleSection(NamedTuple):
+    """Represents a scheduled course section with all necessary details.
 
-    def __init__(self,
-                 course_id: str,
-                 section_number: int,
-                 professor_id: str,
-                 hall_id: str,
-                 time_slot: TimeSlot):
-        """
-        Initialize a schedule section.
+    An immutable named tuple: sections are never modified once placed
+    (backtracking replaces them wholesale), and tuple storage keeps large
+    schedules compact.
+    """
 
-        Args:
-            course_id: Course identifier
-            section_number: Section number for this course
-            professor_id: Professor assigned to this section
-            hall_id: Hall assigned to this section
-            time_slot: Time slot assigned to this section
-        """
-        self.course_id = course_id
-        self.section_number = section_number
-        self.professor_id = professor_id
-        self.hall_id = hall_id
-        self.time_slot = time_slot
+    course_id: str
+    section_number: int
+    professor_id: str
+    hall_id: str
+    time_slot: TimeSlot
 
     def __str__(self):
         return (f"Course: {self.course_id}, Section: {self.section_number}, "
                 f"Professor: {self.professor_id}, Hall: {self.hall_id}, "
                 f"Time: {self.time_slot}")
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the section in the flat shape used by the API response."""
+        time_slot = self.time_slot
+        return {
+            'course_id': self.course_id,
+            'section_number': self.section_number,
+            'professor_id': self.professor_id,
+            'hall_id': self.hall_id,
+            'day': time_slot.day,
+            'start_time': time_slot.start_time,
+            'end_time': time_slot.end_time,
+        }
+
 
 class ScheduleGenerator:
     """
@@ -128,7 +150,33 @@ class ScheduleGenerator:
         self.course_sections_count = {}
         self.professor_courses = defaultdict(list)  # Maps professors to their courses
         self.course_professors = defaultdict(list)  # Maps courses to qualified professors
-        self.restricted_time_slots = []  # Pre-computed restricted time slots
+        self._course_to_dept = {}  # Reverse of department_courses
+        self._course_to_level = {}  # Reverse of level_courses (first level wins)
+        self._course_levels = {}  # course -> tuple of every level listing it
+        self._level_day_counts = {}  # level -> per-school-day section counts
+        self._course_day_counts = defaultdict(list)  # course -> per-day section counts
+        self._infeasible_slots = defaultdict(set)  # course -> {(day, start)} known dead
+        self._prof_day_slots = defaultdict(list)  # (prof, day) -> scheduled slots
+        self._course_day_slots = defaultdict(list)  # (course, day) -> scheduled slots
+        self._level_tod_counts = defaultdict(lambda: [0, 0, 0])  # (level, day) -> tod buckets
+        self._course_distribution = {}  # course -> (needed, ideal/day, max variance)
+        self._time_pref_memo = {}  # (course, day, start) -> preference score
+        self._prof_pref_memo = {}  # (prof, day, start, end) -> preferred flag
+        self._course_prof_ranking = {}  # course -> candidates sorted by static score
+        self._dept_to_professors = defaultdict(list)  # Professors by specialty department
+        self._prof_specialty_sets = {}  # professor -> frozenset of specialties
+        self._course_preferred_profs = defaultdict(list)  # Reverse of professor_preferred_courses
+        self._slots_by_duration = {}  # Cached slot tuples keyed by lecture duration
+        self._day_thresholds = {}  # day -> (early_end, middle_end) hour boundaries
+        self._day_bounds = {}  # day -> (start_min, end_min) working hours
+        self._day_id = {}  # day name -> small integer id
+        self._restricted_mask = defaultdict(int)  # day -> restricted-minute bitmask
+        self._prof_pref_by_day = {}  # professor -> day -> [(start_min, end_min)]
+        self._prof_busy = defaultdict(lambda: defaultdict(int))  # professor -> day -> minute bitmask
+        self._hall_busy = defaultdict(lambda: defaultdict(int))  # hall -> day -> minute bitmask
+        self._course_used_slots = defaultdict(set)  # course -> {(day, start_min)} already taken
+        self._prof_load = Counter()  # professor -> number of scheduled sections
+        self._hall_load = Counter()  # hall -> number of scheduled sections
 
     def load_data(self, data: Dict[str, Any]) -> None:
         """
@@ -153,115 +201,245 @@ class ScheduleGenerator:
         self.course_lecture_durations = data.get('course_lecture_durations', {})
         self.course_sections_count = data.get('course_sections_count', {})
 
+        # Small integer ids for days: school days first (so they can index
+        # per-day count arrays), then any day seen only in time windows
+        self._day_id = {day: i for i, day in enumerate(self.school_days)}
+        for day in self.days_with_hours:
+            self._day_id.setdefault(day, len(self._day_id))
+        for restricted in self.restricted_times:
+            self._day_id.setdefault(restricted['day'], len(self._day_id))
+
+        # Reverse maps of level_courses. A course can be listed under
+        # several levels; _course_to_level keeps the first one, as the
+        # old linear scan did, while _course_levels keeps them all for
+        # the per-level balance bookkeeping.
+        course_levels = defaultdict(list)
+        for level, courses in self.level_courses.items():
+            for course in courses:
+                course_levels[course].append(level)
+        self._course_levels = {course: tuple(levels) for course, levels in course_levels.items()}
+        self._course_to_level = {course: levels[0] for course, levels in self._course_levels.items()}
+
         # Precompute professor-course relationships
         self._precompute_course_professor_mappings()
 
         # Precompute restricted time slots
         self._precompute_restricted_time_slots()
 
+        # Slot lists depend only on lecture duration; drop caches from any
+        # previously loaded data set, along with the scorer memos
+        self._slots_by_duration = {}
+        self._time_pref_memo = {}
+        self._prof_pref_memo = {}
+        self._course_prof_ranking = {}
+
+        # Working-day bounds in minutes, parsed once per data set
+        self._day_bounds = {
+            day: (_hhmm_to_min(hours['start']), _hhmm_to_min(hours['end']))
+            for day, hours in self.days_with_hours.items()
+        }
+
+        # Static targets for the section-distribution scorer: sections
+        # needed, ideal sections per school day, and the worst-case
+        # variance (everything on one day) used for normalization
+        self._course_distribution = {}
+        num_days = len(self.school_days)
+        if num_days:
+            for course_id in self.courses:
+                total = self.course_sections_count.get(course_id, 1)
+                ideal = total / num_days
+                max_variance = (total - ideal) ** 2 + (num_days - 1) * (ideal ** 2)
+                self._course_distribution[course_id] = (total, ideal, max_variance)
+
+        # Early/middle thresholds (in hours) splitting each day into thirds
+        # for the time-preference scorer
+        self._day_thresholds = {}
+        for day, hours in self.days_with_hours.items():
+            day_start_hours = _hhmm_to_min(hours['start']) / 60
+            day_duration = _hhmm_to_min(hours['end']) / 60 - day_start_hours
+            self._day_thresholds[day] = (
+                day_start_hours + day_duration / 3,
+                day_start_hours + 2 * day_duration / 3,
+            )
+
     def _precompute_course_professor_mappings(self):
         """Precompute mappings between professors and courses they can teach."""
         self.professor_courses = defaultdict(list)
         self.course_professors = defaultdict(list)
 
-        # First, map courses to departments
-        course_to_dept = {}
+        # First, map courses to departments. A course listed under several
+        # departments keeps the first one, as the old linear scan did.
+        self._course_to_dept = {}
         for dept, courses in self.department_courses.items():
             for course in courses:
-                course_to_dept[course] = dept
+                self._course_to_dept.setdefault(course, dept)
+
+        # Frozen specialty sets for O(1) membership in the professor
+        # scorer; the raw lists keep their order for the builds below
+        self._prof_specialty_sets = {
+            professor_id: frozenset(specialties)
+            for professor_id, specialties in self.professor_specialties.items()
+        }
 
         # Map professors to courses they can teach based on specialty
+        self._dept_to_professors = defaultdict(list)
         for professor_id, specialties in self.professor_specialties.items():
             for specialty in specialties:
+                self._dept_to_professors[specialty].append(professor_id)
                 # Find all courses in this specialty's department
                 for course in self.department_courses.get(specialty, []):
                     self.professor_courses[professor_id].append(course)
                     self.course_professors[course].append(professor_id)
 
-        # Add preferred courses
+        # Add preferred courses, and keep the reverse map for scoring.
+        # A set shadow of professor_courses makes the duplicate check O(1)
+        # while the lists keep their deterministic insertion order.
+        professor_course_sets = {
+            professor_id: set(courses)
+            for professor_id, courses in self.professor_courses.items()
+        }
+        self._course_preferred_profs = defaultdict(list)
         for professor_id, preferred_courses in self.professor_preferred_courses.items():
+            taught = professor_course_sets.setdefault(professor_id, set())
             for course in preferred_courses:
-                if course not in self.professor_courses[professor_id]:
+                self._course_preferred_profs[course].append(professor_id)
+                if course not in taught:
+                    taught.add(course)
                     self.professor_courses[professor_id].append(course)
                     self.course_professors[course].append(professor_id)
 
     def _precompute_restricted_time_slots(self):
-        """Precompute restricted time slots for faster checks."""
-        self.restricted_time_slots = []
+        """Precompute restricted time windows, indexed by day, for faster checks."""
+        # One minute bitmask per day OR'ing every restricted window, so a
+        # slot's restriction check is a single AND against its own mask
+        self._restricted_mask = defaultdict(int)
         for restricted in self.restricted_times:
-            self.restricted_time_slots.append(
-                TimeSlot(restricted['day'], restricted['start_time'], restricted['end_time'])
-            )
-
-    def _generate_time_slots(self, course_id: str) -> List[TimeSlot]:
+            day_id = self._day_id[restricted['day']]
+            start_min = _hhmm_to_min(restricted['start_time'])
+            end_min = _hhmm_to_min(restricted['end_time'])
+            self._restricted_mask[day_id] |= (1 << end_min) - (1 << start_min)
+
+        # Preferred teaching windows as integer intervals, also per day, so
+        # preference checks don't rebuild TimeSlot objects on every call.
+        self._prof_pref_by_day = {}
+        for professor_id, preferred_times in self.professor_preferred_times.items():
+            by_day = defaultdict(list)
+            for preferred in preferred_times:
+                day_id = self._day_id.setdefault(preferred['day'], len(self._day_id))
+                by_day[day_id].append(
+                    (_hhmm_to_min(preferred['start_time']), _hhmm_to_min(preferred['end_time']))
+                )
+            self._prof_pref_by_day[professor_id] = by_day
+
+    def _generate_time_slots(self, course_id: str) -> Tuple[TimeSlot, ...]:
         """
         Generate all possible time slots for a course.
 
+        Courses with the same lecture duration share one immutable,
+        lazily-built slot tuple.
+
         Args:
             course_id: Course identifier
 
         Returns:
-            List of possible time slots for the course
+            Tuple of possible time slots for the course
         """
-        all_time_slots = []
         lecture_duration = self.course_lecture_durations.get(course_id, 60)  # Default 60 minutes
+        cached = self._slots_by_duration.get(lecture_duration)
+        if cached is not None:
+            return cached
 
-        for day, hours in self.days_with_hours.items():
-            start_hour, start_minute = map(int, hours['start'].split(':'))
-            end_hour, end_minute = map(int, hours['end'].split(':'))
-
-            start_time = datetime.strptime(f"{start_hour}:{start_minute}", "%H:%M")
-            end_time = datetime.strptime(f"{end_hour}:{end_minute}", "%H:%M")
-
-            # Calculate the number of minutes between start and end
-            total_minutes = (end_time - start_time).seconds // 60
-
-            # Generate time slots with the course's lecture duration
-            # Add 5 minutes break between potential slots
-            current_time = start_time
-            while current_time + timedelta(minutes=lecture_duration) <= end_time:
-                slot_start = current_time.strftime("%H:%M")
-                slot_end = (current_time + timedelta(minutes=lecture_duration)).strftime("%H:%M")
-
-                # Create a time slot
-                time_slot = TimeSlot(day, slot_start, slot_end)
-
-                # Check if this time slot is restricted
-                is_restricted = False
-                for restricted_slot in self.restricted_time_slots:
-                    if time_slot.overlaps(restricted_slot):
-                        is_restricted = True
-                        break
-
-                if not is_restricted:
+        all_time_slots = []
+        for day, (day_start, day_end) in self._day_bounds.items():
+            day_id = self._day_id[day]
+            restricted_mask = self._restricted_mask.get(day_id, 0)
+
+            # Generate time slots with the course's lecture duration,
+            # leaving a 5 minute break between consecutive start times
+            for slot_start in range(day_start, day_end - lecture_duration + 1, lecture_duration + 5):
+                time_slot = TimeSlot(
+                    day, _min_to_hhmm(slot_start), _min_to_hhmm(slot_start + lecture_duration),
+                    day_id
+                )
+
+                # Skip slots touching a restricted window on this day
+                if not (time_slot.mask & restricted_mask):
                     all_time_slots.append(time_slot)
 
-                # Move to the next potential start time (add lecture duration + break)
-                current_time += timedelta(minutes=lecture_duration + 5)
-
-        return all_time_slots
-
-    def _is_professor_available(self,
-                                professor_id: str,
-                                time_slot: TimeSlot,
-                                existing_schedule: List[ScheduleSection]) -> bool:
+        slots = tuple(all_time_slots)
+        self._slots_by_duration[lecture_duration] = slots
+        return slots
+
+    def _add_section_to_index(self, section: ScheduleSection) -> None:
+        """Record a scheduled section in the incremental availability indexes."""
+        time_slot = section.time_slot
+        self._prof_busy[section.professor_id][time_slot.day_id] |= time_slot.mask
+        self._hall_busy[section.hall_id][time_slot.day_id] |= time_slot.mask
+        self._course_used_slots[section.course_id].add((time_slot.day_id, time_slot.start_min))
+        self._prof_load[section.professor_id] += 1
+        self._hall_load[section.hall_id] += 1
+        self._course_day_counts[section.course_id][time_slot.day_id] += 1
+        self._prof_day_slots[(section.professor_id, time_slot.day_id)].append(time_slot)
+        self._course_day_slots[(section.course_id, time_slot.day_id)].append(time_slot)
+        tod_bucket = 0 if time_slot.start_min < 720 else 1 if time_slot.start_min < 1020 else 2
+        for level in self._course_levels.get(section.course_id, ()):
+            self._level_tod_counts[(level, time_slot.day_id)][tod_bucket] += 1
+        if 0 <= time_slot.day_id < len(self.school_days):
+            for level in self._course_levels.get(section.course_id, ()):
+                self._level_day_counts[level][time_slot.day_id] += 1
+
+    def _remove_section_from_index(self, section: ScheduleSection) -> None:
+        """Remove a section from the incremental availability indexes."""
+        # Unplacing frees resources, so cached infeasibility no longer holds
+        self._infeasible_slots.clear()
+        time_slot = section.time_slot
+        self._prof_busy[section.professor_id][time_slot.day_id] &= ~time_slot.mask
+        self._hall_busy[section.hall_id][time_slot.day_id] &= ~time_slot.mask
+        self._course_used_slots[section.course_id].discard((time_slot.day_id, time_slot.start_min))
+        self._prof_load[section.professor_id] -= 1
+        self._hall_load[section.hall_id] -= 1
+        self._course_day_counts[section.course_id][time_slot.day_id] -= 1
+        self._prof_day_slots[(section.professor_id, time_slot.day_id)].remove(time_slot)
+        self._course_day_slots[(section.course_id, time_slot.day_id)].remove(time_slot)
+        tod_bucket = 0 if time_slot.start_min < 720 else 1 if time_slot.start_min < 1020 else 2
+        for level in self._course_levels.get(section.course_id, ()):
+            self._level_tod_counts[(level, time_slot.day_id)][tod_bucket] -= 1
+        if 0 <= time_slot.day_id < len(self.school_days):
+            for level in self._course_levels.get(section.course_id, ()):
+                self._level_day_counts[level][time_slot.day_id] -= 1
+
+    def _reset_schedule_indexes(self) -> None:
+        """Clear the incremental indexes before a new generation run."""
+        self._prof_busy = defaultdict(lambda: defaultdict(int))
+        self._hall_busy = defaultdict(lambda: defaultdict(int))
+        self._course_used_slots = defaultdict(set)
+        self._prof_load = Counter()
+        self._hall_load = Counter()
+        self._level_day_counts = {
+            level: [0] * len(self.school_days) for level in self.level_courses
+        }
+        # Sized to every known day id, not just school days, since slots
+        # can fall on any day that appears in days_with_hours
+        num_day_ids = len(self._day_id)
+        self._course_day_counts = defaultdict(lambda: [0] * num_day_ids)
+        self._infeasible_slots = defaultdict(set)
+        self._prof_day_slots = defaultdict(list)
+        self._course_day_slots = defaultdict(list)
+        self._level_tod_counts = defaultdict(lambda: [0, 0, 0])
+
+    def _is_professor_available(self, professor_id: str, time_slot: TimeSlot) -> bool:
         """
         Check if a professor is available at a given time slot.
 
         Args:
             professor_id: Professor identifier
             time_slot: Time slot to check
-            existing_schedule: Existing schedule sections
 
         Returns:
             True if the professor is available, False otherwise
         """
-        # Check if the professor is already scheduled during this time slot
-        for section in existing_schedule:
-            if section.professor_id == professor_id and section.time_slot.overlaps(time_slot):
-                return False
-
-        return True
+        # Only this professor's sections on this day can conflict
+        return not (self._prof_busy[professor_id].get(time_slot.day_id, 0) & time_slot.mask)
 
     def _is_professor_preferred_time(self, professor_id: str, time_slot: TimeSlot) -> bool:
         """
@@ -274,47 +452,36 @@ class ScheduleGenerator:
         Returns:
             True if the time slot is within a preferred time, False otherwise
         """
-        if professor_id not in self.professor_preferred_times:
+        by_day = self._prof_pref_by_day.get(professor_id)
+        if not by_day:
             return True  # No preferences specified, so any time is okay
 
-        preferred_times = self.professor_preferred_times[professor_id]
-        if not preferred_times:
-            return True  # No specific preferences, so any time is okay
-
-        for preferred in preferred_times:
-            preferred_slot = TimeSlot(
-                preferred['day'],
-                preferred['start_time'],
-                preferred['end_time']
-            )
-            # Check if the time slot is within the preferred time frame
-            if time_slot.day == preferred_slot.day:
-                if (time_slot._start_dt >= preferred_slot._start_dt and
-                    time_slot._end_dt <= preferred_slot._end_dt):
-                    return True
-
-        return False
-
-    def _is_hall_available(self,
-                           hall_id: str,
-                           time_slot: TimeSlot,
-                           existing_schedule: List[ScheduleSection]) -> bool:
+        # Pure in (professor, day, slot times); memoized for the ranking loops
+        memo_key = (professor_id, time_slot.day_id, time_slot.start_min, time_slot.end_min)
+        cached = self._prof_pref_memo.get(memo_key)
+        if cached is not None:
+            return cached
+
+        # Check if the time slot is within a preferred time frame that day
+        preferred = any(
+            time_slot.start_min >= start_min and time_slot.end_min <= end_min
+            for start_min, end_min in by_day.get(time_slot.day_id, ())
+        )
+        self._prof_pref_memo[memo_key] = preferred
+        return preferred
+
+    def _is_hall_available(self, hall_id: str, time_slot: TimeSlot) -> bool:
         """
         Check if a hall is available at a given time slot.
 
         Args:
             hall_id: Hall identifier
             time_slot: Time slot to check
-            existing_schedule: Existing schedule sections
 
         Returns:
             True if the hall is available, False otherwise
         """
-        for section in existing_schedule:
-            if section.hall_id == hall_id and section.time_slot.overlaps(time_slot):
-                return False
-
-        return True
+        return not (self._hall_busy[hall_id].get(time_slot.day_id, 0) & time_slot.mask)
 
     def _find_suitable_professor(self,
                                  course_id: str,
@@ -332,51 +499,54 @@ class ScheduleGenerator:
         Returns:
             Professor identifier if found, None otherwise
         """
-        # Get all professors who can teach this course
-        candidates = list(self.course_professors.get(course_id, []))
-
-        # If no specific professors for this course, try all professors
-        if not candidates:
-            candidates = self.professors
-
-        # Score and rank professors by suitability
-        scored_candidates = []
-        for professor_id in candidates:
-            if not self._is_professor_available(professor_id, time_slot, existing_schedule):
+        # Candidates presorted by their static score (course preference
+        # and specialty bonuses), built lazily once per course. The
+        # original candidate position rides along for tie-breaking.
+        ranking = self._course_prof_ranking.get(course_id)
+        if ranking is None:
+            candidates = self.course_professors.get(course_id) or self.professors
+            course_dept = self._course_to_dept.get(course_id)
+            ranking = []
+            for position, professor_id in enumerate(candidates):
+                static_score = 0
+                # Higher score for professors who prefer this course
+                preferred = self.professor_preferred_courses.get(professor_id)
+                if preferred and course_id in preferred:
+                    static_score += 30
+                # Higher score for professors who specialize in the course's department
+                if course_dept and course_dept in self._prof_specialty_sets.get(professor_id, ()):
+                    static_score += 20
+                ranking.append((-static_score, position, professor_id))
+            ranking.sort()
+            self._course_prof_ranking[course_id] = ranking
+
+        # Walk best-static-first; the dynamic terms add at most 10 (time
+        # preference) and only subtract (workload), so once the best full
+        # score beats static + 10 no later candidate can win or tie.
+        best_key = None
+        best_professor = None
+        for neg_static, position, professor_id in ranking:
+            if best_key is not None and -best_key[0] > -neg_static + 10:
+                break
+            if not self._is_professor_available(professor_id, time_slot):
                 continue
 
-            score = 0
-
-            # Higher score for professors who prefer this course
-            if professor_id in self.professor_preferred_courses and course_id in self.professor_preferred_courses[professor_id]:
-                score += 30
-
-            # Higher score for professors who specialize in the course's department
-            course_dept = None
-            for dept, courses in self.department_courses.items():
-                if course_id in courses:
-                    course_dept = dept
-                    break
-
-            if course_dept and professor_id in self.professor_specialties:
-                if course_dept in self.professor_specialties[professor_id]:
-                    score += 20
+            score = -neg_static
 
             # Higher score for professors who prefer this time slot
             if self._is_professor_preferred_time(professor_id, time_slot):
                 score += 10
 
             # Add workload balance factor - prefer professors with fewer courses
-            prof_sections = sum(1 for section in existing_schedule if section.professor_id == professor_id)
-            score -= prof_sections * 2  # Penalize heavily loaded professors
-
-            scored_candidates.append((professor_id, score))
+            score -= self._prof_load[professor_id] * 2  # Penalize heavily loaded professors
 
-        # Sort by score (highest first)
-        scored_candidates.sort(key=lambda x: x[1], reverse=True)
+            # Highest score wins; the earlier original candidate wins ties
+            key = (-score, position)
+            if best_key is None or key < best_key:
+                best_key = key
+                best_professor = professor_id
 
-        # Return the best candidate, or None if no suitable professor found
-        return scored_candidates[0][0] if scored_candidates else None
+        return best_professor
 
     def _find_suitable_hall(self,
                             time_slot: TimeSlot,
@@ -391,16 +561,12 @@ class ScheduleGenerator:
         Returns:
             Hall identifier if found, None otherwise
         """
-        # Count current usage of each hall
-        hall_usage = {hall_id: 0 for hall_id in self.halls}
-        for section in existing_schedule:
-            hall_usage[section.hall_id] = hall_usage.get(section.hall_id, 0) + 1
-
-        # Find available halls
+        # Find available halls with their current usage counts
+        hall_load = self._hall_load
         available_halls = []
         for hall_id in self.halls:
-            if self._is_hall_available(hall_id, time_slot, existing_schedule):
-                available_halls.append((hall_id, hall_usage[hall_id]))
+            if self._is_hall_available(hall_id, time_slot):
+                available_halls.append((hall_id, hall_load[hall_id]))
 
         # Sort by usage (least used first)
         available_halls.sort(key=lambda x: x[1])
@@ -410,53 +576,43 @@ class ScheduleGenerator:
 
     def _are_sections_well_distributed(self,
                                        course_id: str,
-                                       new_time_slot: TimeSlot,
-                                       existing_schedule: List[ScheduleSection]) -> float:
+                                       new_time_slot: TimeSlot) -> float:
         """
         Evaluate how well distributed the sections would be if a new section is added.
 
+        Reads only the incremental per-course indexes; nothing here scans
+        the schedule.
+
         Args:
             course_id: Course identifier
             new_time_slot: New time slot to check
-            existing_schedule: Existing schedule sections
 
         Returns:
             Score between 0 and 1, higher is better distribution
         """
-        # Get existing sections for this course
-        course_sections = [
-            section for section in existing_schedule
-            if section.course_id == course_id
-        ]
-
-        # Get number of sections required for this course
-        total_sections_needed = self.course_sections_count.get(course_id, 1)
+        # Static distribution targets, precomputed in load_data
+        total_sections_needed, ideal_per_day, max_variance = self._course_distribution.get(
+            course_id, (1, 0.0, 0.0)
+        )
 
         # If no sections exist yet, any day is fine
-        if not course_sections:
+        existing_counts = self._course_day_counts.get(course_id)
+        if existing_counts is None or not any(existing_counts):
             return 1.0
 
         # If only one section needed, any day is fine
         if total_sections_needed == 1:
             return 1.0
 
-        # Count sections per day
-        day_counts = defaultdict(int)
-        for section in course_sections:
-            day_counts[section.time_slot.day] += 1
-
-        # Add the potential new section
-        day_counts[new_time_slot.day] += 1
+        # Sections per day for this course, maintained incrementally;
+        # add the potential new section before measuring
+        day_counts = list(existing_counts)
+        day_counts[new_time_slot.day_id] += 1
 
-        # Calculate ideal distribution
-        ideal_per_day = total_sections_needed / len(self.school_days)
-
-        # Calculate variance from ideal
-        variance = sum((count - ideal_per_day) ** 2 for count in day_counts.values())
-
-        # Normalize to 0-1 score (lower variance is better)
-        # Maximum possible variance is when all sections are on one day
-        max_variance = (total_sections_needed - ideal_per_day) ** 2 + (len(self.school_days) - 1) * (ideal_per_day ** 2)
+        # Calculate variance from ideal (lower is better); only days that
+        # hold at least one section contribute, as with the old per-day
+        # dict. max_variance is the worst case of everything on one day
+        variance = sum((count - ideal_per_day) ** 2 for count in day_counts if count)
 
         if max_variance == 0:  # Edge case
             return 1.0
@@ -464,14 +620,11 @@ class ScheduleGenerator:
         distribution_score = 1.0 - (variance / max_variance)
 
         # Check if we can improve spacing between sections on the same day
-        if day_counts[new_time_slot.day] > 1:
+        if day_counts[new_time_slot.day_id] > 1:
             # Check spacing between sections on this day
-            same_day_sections = [section for section in course_sections
-                                if section.time_slot.day == new_time_slot.day]
-
             min_spacing = float('inf')
-            for section in same_day_sections:
-                spacing = abs(new_time_slot.get_minutes_difference(section.time_slot) or 0)
+            for slot in self._course_day_slots.get((course_id, new_time_slot.day_id), ()):
+                spacing = abs(new_time_slot.get_minutes_difference(slot) or 0)
                 min_spacing = min(min_spacing, spacing)
 
             # Normalize spacing factor (0 is bad, 120+ minutes is ideal)
@@ -485,41 +638,35 @@ class ScheduleGenerator:
     def _is_level_schedule_balanced(self,
                                     level: str,
                                     course_id: str,
-                                    new_time_slot: TimeSlot,
-                                    existing_schedule: List[ScheduleSection]) -> float:
+                                    new_time_slot: TimeSlot) -> float:
         """
         Evaluate how balanced the level schedule would be after adding a new section.
 
+        Reads only the incremental per-level indexes; nothing here scans
+        the schedule.
+
         Args:
             level: Level identifier
             course_id: Course identifier
             new_time_slot: New time slot to check
-            existing_schedule: Existing schedule sections
 
         Returns:
             Score between 0 and 1, higher is better balance
         """
-        # Get all courses for this level
-        level_course_ids = self.level_courses.get(level, [])
-
-        if course_id not in level_course_ids:
+        if level not in self._course_levels.get(course_id, ()):
             return 1.0  # Not a course for this level
 
-        # Count sections per day for this level
-        day_counts = {day: 0 for day in self.school_days}
-
-        for section in existing_schedule:
-            if section.course_id in level_course_ids:
-                day_counts[section.time_slot.day] += 1
-
-        # Add the new section
-        day_counts[new_time_slot.day] += 1
+        # Sections per day for this level, maintained incrementally on
+        # placement add/remove; add the new section before measuring
+        day_counts = list(self._level_day_counts[level])
+        if 0 <= new_time_slot.day_id < len(day_counts):
+            day_counts[new_time_slot.day_id] += 1
 
         # Calculate average sections per day
-        avg_count = sum(day_counts.values()) / len(day_counts)
+        avg_count = sum(day_counts) / len(day_counts)
 
         # Calculate standard deviation
-        variance = sum((count - avg_count) ** 2 for count in day_counts.values()) / len(day_counts)
+        variance = sum((count - avg_count) ** 2 for count in day_counts) / len(day_counts)
         std_dev = variance ** 0.5
 
         # Calculate a balance score (lower std_dev is better)
@@ -531,32 +678,18 @@ class ScheduleGenerator:
 
         balance_score = 1.0 - (std_dev / max_imbalance)
 
-        # Check for time slot distribution within the day
-        # Group existing sections by time of day (morning, afternoon, evening)
-        time_of_day_counts = {'morning': 0, 'afternoon': 0, 'evening': 0}
-
-        for section in existing_schedule:
-            if section.course_id in level_course_ids and section.time_slot.day == new_time_slot.day:
-                hours = int(section.time_slot.start_time.split(':')[0])
-                if hours < 12:
-                    time_of_day_counts['morning'] += 1
-                elif hours < 17:
-                    time_of_day_counts['afternoon'] += 1
-                else:
-                    time_of_day_counts['evening'] += 1
-
-        # Add the new section
-        hours = int(new_time_slot.start_time.split(':')[0])
-        if hours < 12:
-            time_of_day_counts['morning'] += 1
-        elif hours < 17:
-            time_of_day_counts['afternoon'] += 1
-        else:
-            time_of_day_counts['evening'] += 1
+        # Check for time slot distribution within the day. Buckets are
+        # morning / afternoon / evening, maintained incrementally per
+        # (level, day); add the new section before measuring.
+        time_of_day_counts = list(
+            self._level_tod_counts.get((level, new_time_slot.day_id), (0, 0, 0))
+        )
+        hours = new_time_slot.start_min // 60
+        time_of_day_counts[0 if hours < 12 else 1 if hours < 17 else 2] += 1
 
         # Check time of day distribution
-        tod_avg = sum(time_of_day_counts.values()) / 3
-        tod_variance = sum((count - tod_avg) ** 2 for count in time_of_day_counts.values()) / 3
+        tod_avg = sum(time_of_day_counts) / 3
+        tod_variance = sum((count - tod_avg) ** 2 for count in time_of_day_counts) / 3
 
         if tod_avg == 0:  # Edge case
             tod_balance = 1.0
@@ -580,25 +713,22 @@ class ScheduleGenerator:
         if course_id not in self.course_preferred_times:
             return 0.5  # Neutral score for no preference
 
+        # Pure in (course, day, start); memoized for the ranking loops
+        memo_key = (course_id, time_slot.day_id, time_slot.start_min)
+        cached = self._time_pref_memo.get(memo_key)
+        if cached is not None:
+            return cached
+
         preference = self.course_preferred_times[course_id]
 
         # Convert time to hours as float for comparison
-        hours, minutes = map(int, time_slot.start_time.split(':'))
-        time_as_hours = hours + minutes / 60
-
-        # Define time ranges for early, middle, late
-        day_start = self.days_with_hours.get(time_slot.day, {}).get('start', '08:00')
-        day_end = self.days_with_hours.get(time_slot.day, {}).get('end', '18:00')
+        time_as_hours = time_slot.start_min / 60
 
-        start_hours, start_minutes = map(int, day_start.split(':'))
-        end_hours, end_minutes = map(int, day_end.split(':'))
-
-        day_start_hours = start_hours + start_minutes / 60
-        day_end_hours = end_hours + end_minutes / 60
-        day_duration = day_end_hours - day_start_hours
-
-        early_end = day_start_hours + day_duration / 3
-        middle_end = day_start_hours + 2 * day_duration / 3
+        # Early/middle/late boundaries precomputed per day in load_data
+        # (default corresponds to an 08:00-18:00 day)
+        early_end, middle_end = self._day_thresholds.get(
+            time_slot.day, (8 + 10 / 3, 8 + 20 / 3)
+        )
 
         # Check which part of the day this time slot falls into
         time_of_day = None
@@ -609,23 +739,19 @@ class ScheduleGenerator:
         else:
             time_of_day = 'late'
 
-        # Return score based on preference match
+        # Score based on preference match, with more nuanced scoring the
+        # further the slot sits from the preferred part of the day
         if preference == time_of_day:
-            return 1.0
-        else:
-            # More nuanced scoring based on how far from preferred
-            if preference == 'early':
-                if time_of_day == 'middle':
-                    return 0.5
-                else:  # late
-                    return 0.2
-            elif preference == 'middle':
-                return 0.5  # Both early and late are equally less preferred
-            else:  # late
-                if time_of_day == 'middle':
-                    return 0.5
-                else:  # early
-                    return 0.2
+            score = 1.0
+        elif preference == 'early':
+            score = 0.5 if time_of_day == 'middle' else 0.2
+        elif preference == 'middle':
+            score = 0.5  # Both early and late are equally less preferred
+        else:  # late
+            score = 0.5 if time_of_day == 'middle' else 0.2
+
+        self._time_pref_memo[memo_key] = score
+        return score
 
     def _evaluate_candidate(self,
                            course_id: str,
@@ -648,31 +774,17 @@ class ScheduleGenerator:
         Returns:
             Composite score between 0 and 1, higher is better
         """
-        # Weight factors for different criteria
-        weights = {
-            'time_preference': 0.20,
-            'distribution': 0.25,
-            'level_balance': 0.20,
-            'professor_preference': 0.15,
-            'hall_utilization': 0.10,
-            'gaps': 0.10
-        }
-
-        scores = {}
-
         # Course time preference score
-        scores['time_preference'] = self._evaluate_time_preference(course_id, time_slot)
+        time_preference = self._evaluate_time_preference(course_id, time_slot)
 
         # Distribution score
-        scores['distribution'] = self._are_sections_well_distributed(course_id, time_slot, existing_schedule)
+        distribution = self._are_sections_well_distributed(course_id, time_slot)
 
         # Level balance score
         if course_level:
-            scores['level_balance'] = self._is_level_schedule_balanced(
-                course_level, course_id, time_slot, existing_schedule
-            )
+            level_balance = self._is_level_schedule_balanced(course_level, course_id, time_slot)
         else:
-            scores['level_balance'] = 0.5  # Neutral if no level
+            level_balance = 0.5  # Neutral if no level
 
         # Professor preference score
         is_preferred_time = self._is_professor_preferred_time(professor_id, time_slot)
@@ -680,62 +792,209 @@ class ScheduleGenerator:
                               course_id in self.professor_preferred_courses[professor_id])
 
         if is_preferred_time and is_preferred_course:
-            scores['professor_preference'] = 1.0
+            professor_preference = 1.0
         elif is_preferred_time:
-            scores['professor_preference'] = 0.7
+            professor_preference = 0.7
         elif is_preferred_course:
-            scores['professor_preference'] = 0.6
+            professor_preference = 0.6
         else:
-            scores['professor_preference'] = 0.3
+            professor_preference = 0.3
 
         # Hall utilization balance score
-        hall_usage = sum(1 for section in existing_schedule if section.hall_id == hall_id)
+        hall_usage = self._hall_load[hall_id]
         avg_usage = len(existing_schedule) / len(self.halls) if self.halls else 0
 
         if avg_usage == 0:
-            scores['hall_utilization'] = 1.0
+            hall_utilization = 1.0
         else:
             utilization_ratio = hall_usage / avg_usage
             if utilization_ratio <= 1.0:
-                scores['hall_utilization'] = 1.0
+                hall_utilization = 1.0
             else:
-                scores['hall_utilization'] = max(0.0, 1.0 - (utilization_ratio - 1.0) / 2)
+                hall_utilization = max(0.0, 1.0 - (utilization_ratio - 1.0) / 2)
 
         # Professor gaps score - avoid small gaps between classes
-        prof_sections = [section for section in existing_schedule
-                        if section.professor_id == professor_id and
-                           section.time_slot.day == time_slot.day]
-
-        if not prof_sections:
-            scores['gaps'] = 1.0  # No classes yet on this day
+        prof_day_slots = self._prof_day_slots.get((professor_id, time_slot.day_id), ())
+        if not prof_day_slots:
+            gaps = 1.0  # No classes yet on this day
         else:
             # Check for small gaps
             min_gap = float('inf')
-            for section in prof_sections:
-                gap_minutes = time_slot.get_minutes_difference(section.time_slot)
+            for slot in prof_day_slots:
+                gap_minutes = time_slot.get_minutes_difference(slot)
                 if gap_minutes is not None:
                     gap_minutes = abs(gap_minutes)
                     if 0 < gap_minutes < 60:  # Small gap
                         min_gap = min(min_gap, gap_minutes)
 
             if min_gap == float('inf'):
-                scores['gaps'] = 1.0  # No small gaps
+                gaps = 1.0  # No small gaps
             else:
-                scores['gaps'] = min(min_gap / 60, 1.0)  # Higher score for larger gaps
+                gaps = min(min_gap / 60, 1.0)  # Higher score for larger gaps
+
+        # Weighted composite score; the weights are frozen, so they are
+        # folded straight into the expression instead of a per-call dict
+        # (keep _TIME_PREF_WEIGHT/_OTHER_TERMS_MAX in sync when tuning)
+        return (0.20 * time_preference
+                + 0.25 * distribution
+                + 0.20 * level_balance
+                + 0.15 * professor_preference
+                + 0.10 * hall_utilization
+                + 0.10 * gaps)
+
+    # Maximum number of placements undone before the search stops
+    # backtracking and settles for a partial schedule.
+    _MAX_BACKTRACKS = 500
+
+    # Composite-score weight of the time-preference term and the largest
+    # value the remaining terms can contribute together; see
+    # _evaluate_candidate. Together they bound any slot's score from above
+    # by TIME_PREF_WEIGHT * pref + OTHER_TERMS_MAX.
+    _TIME_PREF_WEIGHT = 0.20
+    _OTHER_TERMS_MAX = 0.80
+
+    # The weights sum to 1.0 and every factor tops out at 1.0, so no
+    # candidate can ever score above this.
+    _MAX_CANDIDATE_SCORE = 1.0
+
+    def _rank_candidates(self,
+                         course_id: str,
+                         course_level: Optional[str],
+                         possible_time_slots: List[TimeSlot],
+                         schedule: List[ScheduleSection]) -> Tuple[List[Tuple[float, TimeSlot, str, str]], List[TimeSlot]]:
+        """
+        Score feasible (time slot, professor, hall) triples for one
+        section of a course, best-preference slots first.
+
+        Slots are visited in descending time-preference order; once the
+        best full score found so far exceeds the upper bound of every
+        remaining slot, scoring stops and the untouched slots are
+        returned separately so a backtracking caller can rank them later
+        if it runs out of scored candidates.
 
-        # Calculate weighted composite score
-        composite_score = sum(weight * scores[factor] for factor, weight in weights.items())
+        Args:
+            course_id: Course identifier
+            course_level: Level of the course, if any
+            possible_time_slots: Candidate time slots for the course
+            schedule: Current schedule state
 
-        return composite_score
+        Returns:
+            A (candidates, leftover_slots) pair: candidates is a list of
+            (score, time_slot, professor_id, hall_id) tuples sorted
+            best-first, leftover_slots the slots pruned by the bound
+        """
+        used_slots = self._course_used_slots.get(course_id, ())
+        # Slots that failed feasibility earlier in the run stay infeasible
+        # while placements only accumulate; the cache is cleared whenever
+        # a placement is undone.
+        infeasible = self._infeasible_slots[course_id]
+
+        # Slots already holding a section of this course are out.
+        # Negating the preference keeps ties in generation order under the
+        # ascending sort, matching the original scan order exactly.
+        # Single-section courses (the common case) have nothing in either
+        # skip set on their first ranking, so the per-slot membership
+        # tests are specialized away for them.
+        if used_slots or infeasible:
+            scored_slots = sorted(
+                (
+                    (-self._evaluate_time_preference(course_id, time_slot), generation_order, time_slot)
+                    for generation_order, time_slot in enumerate(possible_time_slots)
+                    if (time_slot.day_id, time_slot.start_min) not in used_slots
+                    and (time_slot.day_id, time_slot.start_min) not in infeasible
+                ),
+            )
+        else:
+            scored_slots = sorted(
+                (-self._evaluate_time_preference(course_id, time_slot), generation_order, time_slot)
+                for generation_order, time_slot in enumerate(possible_time_slots)
+            )
+
+        candidates = []
+        leftover = []
+        # -inf rather than a finite sentinel, so the cutoffs stay correct
+        # even if a scorer ever returns a negative value
+        best_score = -math.inf
+        # Per-day masks of minutes where every hall, or every professor
+        # eligible for this course, is already busy; any slot touching
+        # such a minute is infeasible and can be skipped wholesale.
+        prof_candidates = self.course_professors.get(course_id) or self.professors
+        saturated_by_day = {}
+
+        for position, (neg_pref, generation_order, time_slot) in enumerate(scored_slots):
+            # No remaining slot can beat or tie the best found: stop scoring
+            if -self._TIME_PREF_WEIGHT * neg_pref + self._OTHER_TERMS_MAX < best_score:
+                leftover = [entry[2] for entry in scored_slots[position:]]
+                break
+
+            day_id = time_slot.day_id
+            saturated = saturated_by_day.get(day_id)
+            if saturated is None:
+                hall_saturated = -1
+                for hall_id in self.halls:
+                    hall_saturated &= self._hall_busy[hall_id].get(day_id, 0)
+                    if not hall_saturated:
+                        break
+                prof_saturated = -1
+                for professor_id in prof_candidates:
+                    prof_saturated &= self._prof_busy[professor_id].get(day_id, 0)
+                    if not prof_saturated:
+                        break
+                saturated = hall_saturated | prof_saturated
+                saturated_by_day[day_id] = saturated
+            if saturated and (time_slot.mask & saturated):
+                infeasible.add((day_id, time_slot.start_min))
+                continue
+
+            # Hall feasibility is a handful of bit operations, professor
+            # selection a full scoring pass - test the cheap one first so
+            # saturated slots never reach the professor loop.
+            hall_id = self._find_suitable_hall(time_slot, schedule)
+            if not hall_id:
+                infeasible.add((day_id, time_slot.start_min))
+                continue
+
+            professor_id = self._find_suitable_professor(course_id, time_slot, schedule)
+            if not professor_id:
+                infeasible.add((day_id, time_slot.start_min))
+                continue
+
+            score = self._evaluate_candidate(
+                course_id, time_slot, professor_id, hall_id, schedule, course_level
+            )
+            candidates.append((score, generation_order, time_slot, professor_id, hall_id))
+            if score > best_score:
+                best_score = score
+                # A perfect score can at best be tied, and a tying slot
+                # would need the same maximal time preference, placing it
+                # later in generation order too - so it loses the tie.
+                if best_score >= self._MAX_CANDIDATE_SCORE:
+                    leftover = [entry[2] for entry in scored_slots[position + 1:]]
+                    break
+
+        # Earlier-generated slots win score ties, matching the strict
+        # "better score wins" rule of the original generation-order scan.
+        candidates.sort(key=lambda candidate: (-candidate[0], candidate[1]))
+        return (
+            [(score, time_slot, professor_id, hall_id)
+             for score, _, time_slot, professor_id, hall_id in candidates],
+            leftover,
+        )
 
     def generate_schedule(self) -> List[ScheduleSection]:
         """
         Generate an optimal class schedule based on the provided data and constraints.
 
+        Uses greedy best-first placement with chronological backtracking:
+        when a section has no feasible candidate left, the most recent
+        placement is undone and its next-best candidate is tried instead,
+        up to a bounded number of undo steps.
+
         Returns:
             List of scheduled course sections
         """
         schedule = []
+        self._reset_schedule_indexes()
 
         # Sort courses by number of sections (decreasing) to schedule the most constrained courses first
         # Also consider the total schedule slots available vs. required
@@ -760,77 +1019,141 @@ class ScheduleGenerator:
 
             course_priority[course_id] = priority
 
-                    # Sort courses by priority (highest first)
-        sorted_courses = sorted(self.courses, key=lambda c: course_priority[c], reverse=True)
+        # Sort courses by priority (highest first) decorate-sort-undecorate
+        # style: one dict lookup per course instead of one per comparison,
+        # and no key function at all. The negated priority sorts highest
+        # first and the input index keeps ties in original course order.
+        decorated = [
+            (-course_priority[course_id], input_order, course_id)
+            for input_order, course_id in enumerate(self.courses)
+        ]
+        decorated.sort()
+        sorted_courses = [entry[2] for entry in decorated]
 
+        # Flatten courses into one variable per required section, in
+        # priority order, so the search can backtrack across courses.
+        variables = []
         for course_id in sorted_courses:
             num_sections = self.course_sections_count.get(course_id, 1)
-            course_level = None
-
-            # Find the level for this course
-            for level, courses in self.level_courses.items():
-                if course_id in courses:
-                    course_level = level
-                    break
+            course_level = self._course_to_level.get(course_id)
 
             # Generate all possible time slots for this course
             possible_time_slots = self._generate_time_slots(course_id)
 
-            # No random shuffle - we'll evaluate all slots systematically
-            sections_created = 0
-            while sections_created < num_sections and possible_time_slots:
-                best_slot = None
-                best_professor = None
-                best_hall = None
-                best_score = -1
+            for section_number in range(1, num_sections + 1):
+                variables.append((course_id, course_level, section_number, possible_time_slots))
 
-                # Try all possible time slots
-                for time_slot in possible_time_slots:
-                    # Find a suitable professor
-                    professor_id = self._find_suitable_professor(course_id, time_slot, schedule)
-                    if not professor_id:
-                        continue
-
-                    # Find a suitable hall
-                    hall_id = self._find_suitable_hall(time_slot, schedule)
-                    if not hall_id:
-                        continue
-
-                    # Comprehensively evaluate this candidate
-                    score = self._evaluate_candidate(
-                        course_id, time_slot, professor_id, hall_id, schedule, course_level
-                    )
+        # Skip per-placement log formatting entirely when INFO is filtered
+        log_placements = _logger.isEnabledFor(logging.INFO)
 
-                    if score > best_score:
-                        best_score = score
-                        best_slot = time_slot
-                        best_professor = professor_id
-                        best_hall = hall_id
-
-                if best_slot:
-                    # Create a new section with the best options
-                    section = ScheduleSection(
-                        course_id=course_id,
-                        section_number=sections_created + 1,
-                        professor_id=best_professor,
-                        hall_id=best_hall,
-                        time_slot=best_slot
-                    )
+        trail = []  # One (variable_index, candidates, position, leftover, section) frame per placement
+        unplaced = set()  # Variable indexes that exhausted their candidates
+        backtracks = 0
+        index = 0
+        revisit = None  # Candidate list carried over when backtracking into a variable
 
-                    schedule.append(section)
-                    sections_created += 1
+        while index < len(variables):
+            course_id, course_level, section_number, possible_time_slots = variables[index]
 
-                    # Remove the used time slot from possibilities
-                    possible_time_slots.remove(best_slot)
+            # No slots exist for this course at all (e.g. the lecture is
+            # longer than any school day); backtracking cannot fix that.
+            if not possible_time_slots:
+                unplaced.add(index)
+                index += 1
+                continue
 
-                    _logger.info(f"Scheduled {course_id} section {sections_created} with score {best_score:.2f}")
-                else:
-                    # If we couldn't find a suitable slot, log a warning
-                    _logger.warning(
-                        f"Could not schedule all sections for course {course_id}. "
-                        f"Scheduled {sections_created} out of {num_sections}."
+            if revisit is not None:
+                candidates, position, leftover = revisit
+                revisit = None
+                # Backtracking drained the scored prefix: rank the slots
+                # the score bound pruned before declaring a dead end.
+                while position >= len(candidates) and leftover:
+                    more, leftover = self._rank_candidates(
+                        course_id, course_level, leftover, schedule
                     )
-                    break
+                    candidates = candidates + more
+            else:
+                candidates, leftover = self._rank_candidates(
+                    course_id, course_level, possible_time_slots, schedule
+                )
+                position = 0
+
+            if position < len(candidates):
+                score, time_slot, professor_id, hall_id = candidates[position]
+                section = ScheduleSection(
+                    course_id=course_id,
+                    section_number=section_number,
+                    professor_id=professor_id,
+                    hall_id=hall_id,
+                    time_slot=time_slot
+                )
+
+                schedule.append(section)
+                self._add_section_to_index(section)
+                trail.append((index, candidates, position, leftover, section))
+
+                if log_placements:
+                    _logger.info("Scheduled %s section %d with score %.2f",
+                                 course_id, section_number, score)
+                index += 1
+                continue
+
+            # Dead end: jump back to the deepest placement that competes
+            # with this course for time - a placement whose slot never
+            # overlaps any candidate slot cannot free a hall or professor
+            # here, so advancing its candidate would only repeat the same
+            # failure. Popped placements above the jump target are
+            # re-attempted on the forward sweep.
+            if trail and backtracks < self._MAX_BACKTRACKS:
+                backtracks += 1
+
+                day_masks = {}
+                for time_slot in possible_time_slots:
+                    day_masks[time_slot.day_id] = day_masks.get(time_slot.day_id, 0) | time_slot.mask
+
+                conflict_depth = len(trail) - 1
+                while conflict_depth >= 0:
+                    frame_slot = trail[conflict_depth][4].time_slot
+                    if frame_slot.mask & day_masks.get(frame_slot.day_id, 0):
+                        break
+                    conflict_depth -= 1
+                if conflict_depth < 0:
+                    # No placement explains the failure (it is intrinsic to
+                    # the domain); fall back to chronological behaviour.
+                    conflict_depth = len(trail) - 1
+
+                while len(trail) - 1 > conflict_depth:
+                    _, _, _, _, popped_section = trail.pop()
+                    schedule.pop()
+                    self._remove_section_from_index(popped_section)
+
+                prev_index, prev_candidates, prev_position, prev_leftover, prev_section = trail.pop()
+                schedule.pop()
+                self._remove_section_from_index(prev_section)
+                unplaced = {i for i in unplaced if i < prev_index}
+                index = prev_index
+                revisit = (prev_candidates, prev_position + 1, prev_leftover)
+                continue
+
+            # Backtracking exhausted (or nothing left to undo): accept a
+            # partial schedule for this section and move on.
+            unplaced.add(index)
+            index += 1
+
+        if backtracks:
+            _logger.info("Backtracked %d times while searching", backtracks)
+
+        # Report shortfalls per course
+        missing_per_course = defaultdict(int)
+        for i in unplaced:
+            missing_per_course[variables[i][0]] += 1
+        for course_id, missing in missing_per_course.items():
+            num_sections = self.course_sections_count.get(course_id, 1)
+            _logger.warning(
+                "Could not schedule all sections for course %s. "
+                "Scheduled %d out of %d.",
+                course_id, num_sections - missing, num_sections,
+            )
 
         return schedule
 
@@ -849,16 +1172,4 @@ class ScheduleGenerator:
         initial_schedule = self.generate_schedule()
 
         # Convert to dictionaries for API response
-        result = []
-        for section in initial_schedule:
-            result.append({
-                'course_id': section.course_id,
-                'section_number': section.section_number,
-                'professor_id': section.professor_id,
-                'hall_id': section.hall_id,
-                'day': section.time_slot.day,
-                'start_time': section.time_slot.start_time,
-                'end_time': section.time_slot.end_time
-            })
-
-        return result
+        return [section.to_dict() for section in initial_schedule]